@@ -0,0 +1,492 @@
+"""
+Synthetic dataset catalog for the Puddle seed script.
+
+The dataset definitions (vendor, metadata and columns) live in
+dataset_catalog.json next to this module and are loaded on first use by
+load_catalog(). This module also provides lookup helpers over the catalog
+and is kept free of heavy imports so other tools can use it cheaply.
+
+dataset_catalog.json layout:
+- "dataset_defaults": field values every dataset gets unless it sets them.
+- "dataset_templates": named sets of field values; a dataset opting in
+  with "template": "<name>" gets them on top of the defaults. Fields the
+  dataset spells out itself always win.
+- "column_templates": column dicts shared verbatim by several datasets,
+  keyed by name. A dataset's "columns" entry may be one of these keys
+  instead of an inline column dict.
+- "vendors": one entry per vendor with its email, display name, notes on
+  which of its datasets join together, optional "dataset_defaults" shared
+  by all of its datasets, and its "datasets".
+
+A dataset's fields resolve in order: global dataset_defaults, then the
+vendor's dataset_defaults, then its template, then the dataset itself.
+"""
+
+import json
+import re
+import sys
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass, asdict
+from datetime import date
+from enum import StrEnum
+from functools import lru_cache
+from itertools import compress
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+CATALOG_PATH = Path(__file__).with_name("dataset_catalog.json")
+
+# Low-cardinality, open-ended string fields; interned at load so each
+# distinct value is a single str object shared by every dataset.
+CATEGORICAL_FIELDS: Tuple[str, ...] = ("status", "visibility", "dataset_type", "granularity")
+
+
+# --- Closed vocabularies ---
+# StrEnum members compare, hash and format as their string value, so they
+# drop into SQL/JSON unchanged while rejecting typos at load time.
+
+class Domain(StrEnum):
+    FINANCE = "Finance"
+    HEALTHCARE = "Healthcare"
+    ENTERTAINMENT_MEDIA = "Entertainment & Media"
+    SPORTS = "Sports"
+    RETAIL = "Retail"
+    TECHNOLOGY = "Technology"
+
+
+class PricingModel(StrEnum):
+    SUBSCRIPTION = "Subscription"
+    ONE_TIME_PURCHASE = "One-time Purchase"
+    USAGE_BASED = "Usage-based"
+    FREE = "Free"
+
+
+class License(StrEnum):
+    COMMERCIAL_USE_ALLOWED = "Commercial Use Allowed"
+    RESEARCH_USE_ONLY = "Research Use Only"
+    PUBLIC_DOMAIN = "Public Domain"
+
+
+# --- Records ---
+
+@dataclass(slots=True, frozen=True)
+class Column:
+    name: str
+    description: str
+    data_type: str
+    sample_values: Tuple[Any, ...]
+
+
+@dataclass(slots=True, frozen=True)
+class TemporalCoverage:
+    start_date: date
+    end_date: date
+    frequency: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form, with dates as ISO strings."""
+        return {
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "frequency": self.frequency,
+        }
+
+
+@dataclass(slots=True, frozen=True)
+class GeographicCoverage:
+    countries: Tuple[str, ...]
+    regions: Tuple[str, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON form."""
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class Dataset:
+    vendor_email: str
+    title: str
+    status: str
+    visibility: str
+    description: str
+    domain: Domain
+    dataset_type: str
+    granularity: str
+    pricing_model: PricingModel
+    license: License
+    topics: Tuple[str, ...]
+    entities: Tuple[str, ...]
+    temporal_coverage: TemporalCoverage
+    geographic_coverage: GeographicCoverage
+    columns: Tuple[Column, ...]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain nested-dict form, as the catalog JSON spells a dataset."""
+        return {**asdict(self), "temporal_coverage": self.temporal_coverage.to_dict()}
+
+
+# --- Loading ---
+
+@lru_cache(maxsize=None)
+def load_catalog() -> Tuple[Dataset, ...]:
+    """
+    Load and resolve the dataset catalog into frozen records. Cached: the
+    JSON file is read once per process and every caller shares the records,
+    so they come back as a tuple; the indexes below hold positions into it.
+    """
+    with open(CATALOG_PATH, encoding="utf-8") as f:
+        raw = json.load(f)
+
+    defaults: Dict[str, Any] = raw["dataset_defaults"]
+    dataset_templates: Dict[str, Dict[str, Any]] = raw["dataset_templates"]
+    templates: Dict[str, Dict[str, Any]] = raw["column_templates"]
+    make_column = _column_factory()
+
+    def dataset_template(name: str) -> Dict[str, Any]:
+        if name not in dataset_templates:
+            raise ValueError(f"unknown dataset template {name!r}")
+        return dataset_templates[name]
+
+    def column_spec(col: Any) -> Dict[str, Any]:
+        # A string entry references column_templates; anything else is inline.
+        if isinstance(col, str):
+            if col not in templates:
+                raise ValueError(f"unknown column template {col!r}")
+            return templates[col]
+        return col
+
+    # Many datasets share identical coverage; hand each distinct value out once.
+    coverages: Dict[Any, Any] = {}
+    datasets: List[Dataset] = []
+    problems: List[str] = []
+    for vendor in raw["vendors"]:
+        for n, entry in enumerate(vendor["datasets"]):
+            try:
+                template = dataset_template(entry["template"]) if "template" in entry else {}
+                ds = {**defaults, **vendor.get("dataset_defaults", {}), **template, **entry}
+                for field in ("title", "description", *CATEGORICAL_FIELDS):
+                    if not isinstance(ds[field], str):
+                        raise TypeError(f"{field} must be a string, not {type(ds[field]).__name__}")
+                for field in ("topics", "entities"):
+                    if not isinstance(ds[field], list) or not all(isinstance(v, str) for v in ds[field]):
+                        raise TypeError(f"{field} must be a list of strings")
+                for field in CATEGORICAL_FIELDS:
+                    ds[field] = sys.intern(ds[field])
+                temporal = TemporalCoverage(
+                    start_date=parse_date(ds["temporal_coverage"]["start_date"]),
+                    end_date=parse_date(ds["temporal_coverage"]["end_date"]),
+                    frequency=sys.intern(ds["temporal_coverage"]["frequency"]),
+                )
+                geographic = GeographicCoverage(
+                    countries=tuple(map(sys.intern, ds["geographic_coverage"]["countries"])),
+                    regions=tuple(map(sys.intern, ds["geographic_coverage"]["regions"])),
+                )
+                datasets.append(Dataset(
+                    vendor_email=sys.intern(vendor["vendor_email"]),
+                    title=ds["title"],
+                    status=ds["status"],
+                    visibility=ds["visibility"],
+                    description=ds["description"],
+                    domain=Domain(ds["domain"]),
+                    dataset_type=ds["dataset_type"],
+                    granularity=ds["granularity"],
+                    pricing_model=PricingModel(ds["pricing_model"]),
+                    license=License(ds["license"]),
+                    topics=tuple(ds["topics"]),
+                    entities=tuple(ds["entities"]),
+                    temporal_coverage=coverages.setdefault(temporal, temporal),
+                    geographic_coverage=coverages.setdefault(geographic, geographic),
+                    columns=tuple(make_column(column_spec(col)) for col in ds["columns"]),
+                ))
+            except (KeyError, TypeError, ValueError) as exc:
+                # Report the entry and keep going so every broken one is listed.
+                label = repr(entry["title"]) if "title" in entry else f"#{n}"
+                detail = f"missing key {exc.args[0]!r}" if isinstance(exc, KeyError) else str(exc)
+                problems.append(f"vendor {vendor.get('vendor_email')!r}, dataset {label}: {detail}")
+    _validate(datasets, problems)
+    return tuple(datasets)
+
+
+# Column types the seed SQL may declare, compiled once for _validate().
+_DATA_TYPE_RE = re.compile(r"DECIMAL\(\d+,\d+\)|VARCHAR\(\d+\)|INTEGER|BIGINT|BOOLEAN|UUID|DATE|TIMESTAMP|TEXT")
+
+
+def _validate(datasets: List[Dataset], problems: List[str]) -> None:
+    """
+    Check the invariants generate_synthetic_data.py relies on, once per load.
+    Raises ValueError listing every problem found, including the ``problems``
+    already hit while building the records.
+    """
+    seen_titles = set()
+    for ds in datasets:
+        # Titles are the lookup key in the generated SQL subqueries.
+        if ds.title in seen_titles:
+            problems.append(f"duplicate title {ds.title!r}")
+        seen_titles.add(ds.title)
+        if not ds.columns:
+            problems.append(f"{ds.title!r}: no columns")
+        names = [col.name for col in ds.columns]
+        if len(set(names)) != len(names):
+            problems.append(f"{ds.title!r}: duplicate column names")
+        for col in ds.columns:
+            if not _DATA_TYPE_RE.fullmatch(col.data_type):
+                problems.append(f"{ds.title!r}: column {col.name!r} has unknown data_type {col.data_type!r}")
+        if ds.temporal_coverage.start_date > ds.temporal_coverage.end_date:
+            problems.append(f"{ds.title!r}: temporal coverage starts after it ends")
+        # These strings are interpolated into SQL literals without escaping.
+        texts = [ds.title, ds.description, ds.vendor_email, ds.status, ds.visibility, ds.domain,
+                 ds.dataset_type, ds.granularity, ds.pricing_model, ds.license, *ds.topics, *ds.entities]
+        texts += [text for col in ds.columns for text in (col.name, col.description, col.data_type)]
+        if any("'" in text for text in texts):
+            problems.append(f"{ds.title!r}: single quote in a field written unescaped to SQL")
+    if problems:
+        raise ValueError("Invalid dataset catalog:\n  - " + "\n  - ".join(problems))
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: ``DATASETS`` is the loaded catalog, read on first access so
+    # importing this module never touches the JSON file.
+    if name == "DATASETS":
+        return load_catalog()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _column_factory() -> Callable[[Dict[str, Any]], Column]:
+    """
+    Return a Column constructor that hands out one shared instance per
+    distinct column, and one shared tuple per distinct sample_values.
+    """
+    # Sample keys include the value types so that e.g. (150000,) and
+    # (150000.0,), which compare equal but serialize differently, stay distinct.
+    samples: Dict[Tuple[Any, ...], Tuple[Any, ...]] = {}
+    columns: Dict[Tuple[Any, ...], Column] = {}
+
+    def make_column(col: Dict[str, Any]) -> Column:
+        values = tuple(col["sample_values"])
+        sample_key = (values, tuple(map(type, values)))
+        if sample_key not in samples:
+            # String samples (placeholder UUIDs, state codes, ...) also recur
+            # across different sample sets, so intern them individually.
+            samples[sample_key] = tuple(sys.intern(v) if isinstance(v, str) else v for v in values)
+        values = samples[sample_key]
+        key = (col["name"], col["description"], col["data_type"], id(values))
+        if key not in columns:
+            # Names and descriptions recur across otherwise distinct columns
+            # ("patient_id", "US state", ...); intern them so they share storage.
+            columns[key] = Column(
+                sys.intern(col["name"]),
+                sys.intern(col["description"]),
+                sys.intern(col["data_type"]),
+                values,
+            )
+        return columns[key]
+
+    return make_column
+
+
+# --- Title / topic prefix index ---
+
+def _tokenize(text: str) -> List[str]:
+    """Lower-cased word tokens of a title or topic string."""
+    return re.findall(r"\w+", text.lower())
+
+
+@lru_cache(maxsize=None)
+def _prefix_index() -> Tuple[Tuple[Tuple[str, int], ...], Tuple[str, ...]]:
+    """
+    Sorted (token, dataset_index) pairs plus the bare token list; a prefix
+    query is a bisect into the tokens followed by a scan over the contiguous
+    run of matches.
+    """
+    pairs = tuple(sorted({
+        (token, i)
+        for i, ds in enumerate(load_catalog())
+        for text in (ds.title, *ds.topics)
+        for token in _tokenize(text)
+    }))
+    return pairs, tuple(token for token, _ in pairs)
+
+
+def _token_hits(token: str, prefix: bool) -> Set[int]:
+    """Indexes of datasets having ``token`` as a word (or as a word prefix)."""
+    pairs, tokens = _prefix_index()
+    hits = set()
+    pos = bisect_left(tokens, token)
+    while pos < len(pairs) and (tokens[pos].startswith(token) if prefix else tokens[pos] == token):
+        hits.add(pairs[pos][1])
+        pos += 1
+    return hits
+
+
+def search_datasets(query: str) -> List[Dataset]:
+    """
+    Return datasets whose title and topic words contain every word of
+    ``query`` (case-insensitive), in catalog order. The last query word may
+    be a prefix, so "stock mar" and "e-comm" both match as-you-type.
+    """
+    words = _tokenize(query)
+    if not words:
+        return []
+    hits = _token_hits(words[-1], prefix=True)
+    for word in words[:-1]:
+        hits &= _token_hits(word, prefix=False)
+    datasets = load_catalog()
+    return [datasets[i] for i in sorted(hits)]
+
+
+# --- Attribute indexes ---
+
+INDEXED_FIELDS: Tuple[str, ...] = ("vendor_email", "domain", "dataset_type", "granularity", "pricing_model")
+
+
+@lru_cache(maxsize=None)
+def _field_index() -> Dict[str, Dict[str, Tuple[int, ...]]]:
+    """Map field -> value -> indexes into the catalog, in catalog order."""
+    index: Dict[str, Dict[str, List[int]]] = {field: defaultdict(list) for field in INDEXED_FIELDS}
+    for i, ds in enumerate(load_catalog()):
+        for field in INDEXED_FIELDS:
+            index[field][getattr(ds, field)].append(i)
+    return {
+        field: {value: tuple(indexes) for value, indexes in buckets.items()}
+        for field, buckets in index.items()
+    }
+
+
+def filter_datasets(**criteria: str) -> List[Dataset]:
+    """
+    Return datasets matching every ``field=value`` criterion, in catalog order.
+    Only INDEXED_FIELDS may be used, e.g. filter_datasets(domain="Healthcare").
+    """
+    unknown = set(criteria) - set(INDEXED_FIELDS)
+    if unknown:
+        raise ValueError(f"Cannot filter on non-indexed field(s): {', '.join(sorted(unknown))}")
+    datasets = load_catalog()
+    if not criteria:
+        return list(datasets)
+    index = _field_index()
+    buckets = sorted((index[field].get(value, ()) for field, value in criteria.items()), key=len)
+    matches = set(buckets[0]).intersection(*buckets[1:])
+    return [datasets[i] for i in sorted(matches)]
+
+
+def _lookup(field: str, value: str) -> List[Dataset]:
+    datasets = load_catalog()
+    return [datasets[i] for i in _field_index()[field].get(value, ())]
+
+
+def by_vendor(vendor_email: str) -> List[Dataset]:
+    """Datasets published by the vendor with this email."""
+    return _lookup("vendor_email", vendor_email)
+
+
+def by_domain(domain: str) -> List[Dataset]:
+    """Datasets in the given domain (e.g. "Healthcare")."""
+    return _lookup("domain", domain)
+
+
+def by_type(dataset_type: str) -> List[Dataset]:
+    """Datasets of the given dataset_type (e.g. "Clinical")."""
+    return _lookup("dataset_type", dataset_type)
+
+
+@lru_cache(maxsize=None)
+def _topic_index() -> Dict[str, Tuple[int, ...]]:
+    """Map topic -> indexes of the datasets listing it, in catalog order."""
+    index: Dict[str, List[int]] = defaultdict(list)
+    for i, ds in enumerate(load_catalog()):
+        for topic in dict.fromkeys(ds.topics):
+            index[topic].append(i)
+    return {topic: tuple(indexes) for topic, indexes in index.items()}
+
+
+def by_topic(topic: str) -> List[Dataset]:
+    """Datasets listing exactly this topic (e.g. "engagement")."""
+    datasets = load_catalog()
+    return [datasets[i] for i in _topic_index().get(topic, ())]
+
+
+@lru_cache(maxsize=None)
+def _title_index() -> Dict[str, int]:
+    """Map title -> index into the catalog; _validate() guarantees titles are unique."""
+    return {ds.title: i for i, ds in enumerate(load_catalog())}
+
+
+def get_dataset(title: str) -> Optional[Dataset]:
+    """The dataset with exactly this title, or None if there is none."""
+    i = _title_index().get(title)
+    return None if i is None else load_catalog()[i]
+
+
+# --- Flattened column table ---
+
+@lru_cache(maxsize=None)
+def _column_table() -> Tuple[array, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Every column in the catalog as parallel sequences: owning dataset index,
+    column name and data_type. Column queries scan these flat sequences
+    instead of walking each dataset's column list.
+    """
+    owners = array("H")
+    names: List[str] = []
+    data_types: List[str] = []
+    for i, ds in enumerate(load_catalog()):
+        for col in ds.columns:
+            owners.append(i)
+            names.append(col.name)
+            data_types.append(col.data_type)
+    return owners, tuple(names), tuple(data_types)
+
+
+def datasets_with_column(name: str, data_type: Optional[str] = None) -> List[Dataset]:
+    """
+    Datasets having a column called ``name`` (and of ``data_type``, if given),
+    in catalog order.
+    """
+    owners, names, data_types = _column_table()
+    hits = sorted({
+        owner
+        for owner, col_name, col_type in zip(owners, names, data_types)
+        if col_name == name and (data_type is None or col_type == data_type)
+    })
+    datasets = load_catalog()
+    return [datasets[i] for i in hits]
+
+
+# --- Temporal coverage filter ---
+
+@lru_cache(maxsize=None)
+def _coverage_bounds() -> Tuple[array, array]:
+    """Coverage start/end of every dataset as date ordinals, parallel to the catalog."""
+    datasets = load_catalog()
+    starts = array("l", (ds.temporal_coverage.start_date.toordinal() for ds in datasets))
+    ends = array("l", (ds.temporal_coverage.end_date.toordinal() for ds in datasets))
+    return starts, ends
+
+
+def datasets_overlapping(start: date, end: date) -> List[Dataset]:
+    """Datasets whose temporal coverage intersects [start, end] (inclusive), in catalog order."""
+    if start > end:
+        raise ValueError(f"start {start} is after end {end}")
+    lo, hi = start.toordinal(), end.toordinal()
+    starts, ends = _coverage_bounds()
+    return list(compress(load_catalog(), [s <= hi and e >= lo for s, e in zip(starts, ends)]))
+
+
+# --- Date sample parsing ---
+
+@lru_cache(maxsize=1024)
+def parse_date(value: str) -> date:
+    """
+    Parse an ISO "YYYY-MM-DD" string. Cached: the catalog only holds a few
+    dozen distinct date strings, so each is parsed once per process.
+    """
+    return date.fromisoformat(value)
+
+
+def date_samples(column: Column) -> Tuple[Optional[date], ...]:
+    """sample_values of a DATE column as datetime.date objects (None kept as None)."""
+    if column.data_type != "DATE":
+        raise ValueError(f"Column '{column.name}' is {column.data_type}, not DATE")
+    return tuple(None if v is None else parse_date(v) for v in column.sample_values)
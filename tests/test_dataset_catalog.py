@@ -0,0 +1,199 @@
+"""Behavior tests for the seed-data catalog helpers in extras/dataset_catalog.py."""
+
+import json
+from datetime import date, timedelta
+
+import pytest
+
+import dataset_catalog
+from dataset_catalog import (
+    by_domain,
+    by_topic,
+    by_type,
+    by_vendor,
+    datasets_overlapping,
+    datasets_with_column,
+    date_samples,
+    filter_datasets,
+    get_dataset,
+    load_catalog,
+    parse_date,
+    search_datasets,
+)
+
+
+def titles(datasets):
+    return [ds.title for ds in datasets]
+
+
+def test_search_matches_word_prefix_case_insensitively():
+    assert "US Stock Market Daily Prices 2020-2024" in titles(search_datasets("STO"))
+
+
+def test_search_splits_multi_word_and_hyphenated_queries():
+    assert titles(search_datasets("stock market")) == ["US Stock Market Daily Prices 2020-2024"]
+    assert titles(search_datasets("stock mar")) == ["US Stock Market Daily Prices 2020-2024"]
+    assert titles(search_datasets("e-commerce")) == ["E-commerce Website Session Data"]
+
+
+def test_search_requires_every_word_to_match():
+    assert search_datasets("stock zzz") == []
+
+
+def test_search_blank_query_matches_nothing():
+    assert search_datasets("  -  ") == []
+
+
+def test_filter_intersects_every_criterion():
+    expected = [ds for ds in load_catalog() if ds.domain == "Healthcare" and ds.pricing_model == "Free"]
+    assert expected
+    result = filter_datasets(domain="Healthcare", pricing_model="Free")
+    assert result == expected
+    assert len(result) < len(by_domain("Healthcare"))
+
+
+def test_filter_without_criteria_returns_whole_catalog():
+    assert filter_datasets() == list(load_catalog())
+
+
+def test_filter_unmatched_value_returns_empty():
+    assert filter_datasets(domain="Healthcare", vendor_email="nobody@example.com") == []
+
+
+def test_filter_rejects_non_indexed_field():
+    with pytest.raises(ValueError, match="title"):
+        filter_datasets(title="anything")
+
+
+def test_single_field_lookups_match_a_linear_scan():
+    catalog = load_catalog()
+    vendor = catalog[0].vendor_email
+    assert by_vendor(vendor) == [ds for ds in catalog if ds.vendor_email == vendor]
+    assert by_domain("Sports") == [ds for ds in catalog if ds.domain == "Sports"]
+    assert by_type("Survey") == [ds for ds in catalog if ds.dataset_type == "Survey"]
+    assert by_vendor("nobody@example.com") == []
+
+
+def test_by_topic_matches_exact_topic_only():
+    assert by_topic("engagement") == [ds for ds in load_catalog() if "engagement" in ds.topics]
+    assert by_topic("engage") == []
+
+
+def test_get_dataset_by_title():
+    ds = load_catalog()[5]
+    assert get_dataset(ds.title) is ds
+    assert get_dataset("No Such Dataset") is None
+
+
+def test_datasets_with_column_filters_by_name_and_type():
+    expected = [ds for ds in load_catalog() if any(col.name == "patient_id" for col in ds.columns)]
+    assert expected
+    assert datasets_with_column("patient_id") == expected
+    assert datasets_with_column("patient_id", data_type="UUID") == expected
+    assert datasets_with_column("patient_id", data_type="BOOLEAN") == []
+
+
+def test_overlap_bounds_are_inclusive():
+    ds = load_catalog()[0]
+    start, end = ds.temporal_coverage.start_date, ds.temporal_coverage.end_date
+    one_day = timedelta(days=1)
+    assert ds in datasets_overlapping(end, end + one_day)
+    assert ds in datasets_overlapping(start - one_day, start)
+    assert ds not in datasets_overlapping(end + one_day, end + 2 * one_day)
+    assert ds not in datasets_overlapping(start - 2 * one_day, start - one_day)
+
+
+def test_overlap_rejects_inverted_range():
+    with pytest.raises(ValueError):
+        datasets_overlapping(date(2024, 1, 2), date(2024, 1, 1))
+
+
+def test_date_samples_parses_date_columns():
+    column = next(col for ds in load_catalog() for col in ds.columns if col.data_type == "DATE")
+    assert date_samples(column) == tuple(None if v is None else date.fromisoformat(v) for v in column.sample_values)
+    assert parse_date("2024-01-15") == date(2024, 1, 15)
+
+
+def test_date_samples_rejects_non_date_column():
+    column = next(col for ds in load_catalog() for col in ds.columns if col.data_type == "UUID")
+    with pytest.raises(ValueError, match="not DATE"):
+        date_samples(column)
+
+
+def test_catalog_and_lookup_results_do_not_share_mutable_state():
+    assert isinstance(load_catalog(), tuple)
+    assert dataset_catalog.DATASETS is load_catalog()
+    first = by_domain("Finance")
+    first.reverse()
+    first.append(None)
+    assert by_domain("Finance") == [ds for ds in load_catalog() if ds.domain == "Finance"]
+
+
+def raw_catalog():
+    """A fresh, editable copy of the catalog JSON."""
+    return json.loads(dataset_catalog.CATALOG_PATH.read_text(encoding="utf-8"))
+
+
+@pytest.fixture
+def use_catalog(tmp_path, monkeypatch):
+    """Return a function that points load_catalog() at an edited raw catalog."""
+    path = tmp_path / "dataset_catalog.json"
+
+    def install(raw):
+        path.write_text(json.dumps(raw), encoding="utf-8")
+        monkeypatch.setattr(dataset_catalog, "CATALOG_PATH", path)
+        load_catalog.cache_clear()
+
+    yield install
+    load_catalog.cache_clear()
+
+
+@pytest.fixture
+def broken_catalog(use_catalog):
+    """Point load_catalog() at a copy of the catalog with three broken entries."""
+    raw = raw_catalog()
+    vendor = raw["vendors"][0]
+    del vendor["datasets"][0]["title"]
+    vendor["datasets"][1]["columns"].append({"name": "x", "description": "x", "data_type": "INTEGER"})
+    vendor["datasets"][2]["domain"] = "Finnance"
+    use_catalog(raw)
+    return vendor
+
+
+def test_load_reports_every_broken_entry_with_its_vendor(broken_catalog):
+    email = broken_catalog["vendor_email"]
+    second, third = broken_catalog["datasets"][1]["title"], broken_catalog["datasets"][2]["title"]
+    with pytest.raises(ValueError) as excinfo:
+        load_catalog()
+    message = str(excinfo.value)
+    assert f"vendor {email!r}, dataset #0: missing key 'title'" in message
+    assert f"vendor {email!r}, dataset {second!r}: missing key 'sample_values'" in message
+    assert f"vendor {email!r}, dataset {third!r}: 'Finnance' is not a valid Domain" in message
+
+
+@pytest.mark.parametrize("field", ["status", "visibility", "dataset_type", "granularity", "description"])
+def test_load_rejects_single_quote_in_sql_interpolated_field(use_catalog, field):
+    raw = raw_catalog()
+    raw["vendors"][0]["datasets"][0][field] = "it's"
+    use_catalog(raw)
+    with pytest.raises(ValueError, match="single quote"):
+        load_catalog()
+
+
+def test_load_reports_wrong_types_and_unknown_templates(use_catalog):
+    raw = raw_catalog()
+    vendor = raw["vendors"][0]
+    entries = vendor["datasets"]
+    entries[0]["status"] = None
+    entries[1]["columns"][-1]["sample_values"] = None
+    entries[2]["template"] = "no_such_template"
+    entries[3]["columns"].append("no_such_column")
+    use_catalog(raw)
+    with pytest.raises(ValueError) as excinfo:
+        load_catalog()
+    message = str(excinfo.value)
+    prefix = f"vendor {vendor['vendor_email']!r}, dataset"
+    assert f"{prefix} {entries[0]['title']!r}: status must be a string, not NoneType" in message
+    assert f"{prefix} {entries[1]['title']!r}: 'NoneType' object is not iterable" in message
+    assert f"{prefix} {entries[2]['title']!r}: unknown dataset template 'no_such_template'" in message
+    assert f"{prefix} {entries[3]['title']!r}: unknown column template 'no_such_column'" in message
@@ -0,0 +1,98 @@
+"""Tests for the concurrent embedding fetch in extras/generate_synthetic_data.py."""
+
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("passlib")
+pytest.importorskip("google.genai")
+pytest.importorskip("dotenv")
+
+import generate_synthetic_data as gsd  # noqa: E402
+from google.genai import errors  # noqa: E402
+
+EXTRAS_DIR = Path(gsd.__file__).parent
+
+
+def api_error(cls, code):
+    return cls(code, {"error": {"code": code, "message": "simulated", "status": "SIMULATED"}})
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(gsd, "EMBEDDING_RETRY_DELAY", 0)
+
+
+def test_embeddings_keep_input_order_and_respect_the_limit(monkeypatch):
+    in_flight = peak = 0
+
+    async def fake_embed(text):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        # Finish out of order so ordering comes from gather, not timing
+        await asyncio.sleep(0.01 * (len(text) % 3))
+        in_flight -= 1
+        return [float(len(text))]
+
+    monkeypatch.setattr(gsd, "generate_embedding_vector", fake_embed)
+    texts = ["x" * n for n in range(1, 21)]
+    vectors = asyncio.run(gsd.generate_embedding_vectors(texts, limit=3))
+    assert vectors == [[float(n)] for n in range(1, 21)]
+    assert peak == 3
+
+
+def test_failed_embedding_is_retried(monkeypatch):
+    calls = []
+
+    async def flaky_embed(text):
+        calls.append(text)
+        if len(calls) < 3:
+            raise api_error(errors.ClientError, 429) if len(calls) == 1 else api_error(errors.ServerError, 503)
+        return [1.0]
+
+    monkeypatch.setattr(gsd, "generate_embedding_vector", flaky_embed)
+    assert asyncio.run(gsd.generate_embedding_vectors(["a"], limit=1)) == [[1.0]]
+    assert len(calls) == 3
+
+
+def test_persistent_embedding_failure_is_raised(monkeypatch):
+    async def failing_embed(text):
+        raise api_error(errors.ClientError, 429)
+
+    monkeypatch.setattr(gsd, "generate_embedding_vector", failing_embed)
+    with pytest.raises(RuntimeError, match="failed after"):
+        asyncio.run(gsd.generate_embedding_vectors(["a"], limit=1))
+
+
+def test_non_transient_embedding_failure_is_not_retried(monkeypatch):
+    calls = []
+
+    async def rejected_embed(text):
+        calls.append(text)
+        raise api_error(errors.ClientError, 400)
+
+    monkeypatch.setattr(gsd, "generate_embedding_vector", rejected_embed)
+    with pytest.raises(errors.ClientError):
+        asyncio.run(gsd.generate_embedding_vectors(["a"], limit=1))
+    assert len(calls) == 1
+
+
+def test_limit_below_one_is_rejected():
+    with pytest.raises(ValueError, match="at least 1"):
+        asyncio.run(gsd.generate_embedding_vectors(["a"], limit=0))
+
+
+@pytest.mark.parametrize("value", ["0", "-1", "many"])
+def test_invalid_concurrency_env_fails_at_startup(value):
+    env = {**os.environ, "EMBEDDING_CONCURRENCY": value}
+    result = subprocess.run(
+        [sys.executable, "-c", "import generate_synthetic_data"],
+        cwd=EXTRAS_DIR, env=env, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode != 0
+    assert "EMBEDDING_CONCURRENCY must be a positive integer" in result.stderr